@@ -33,15 +33,100 @@ PYBIND11_MODULE(scl_fse_cpp, m) {
         .def(py::init<const FSEParams&>());
 
     py::class_<EncodedBlock>(m, "EncodedBlock")
-        .def_readonly("bytes", &EncodedBlock::bytes)
+        // Expose the payload as a bytes object (one copy) instead of letting
+        // the stl caster box every byte into a Python list
+        .def_property_readonly("bytes",
+             [](const EncodedBlock& b) {
+                 return py::bytes(reinterpret_cast<const char*>(b.bytes.data()),
+                                  b.bytes.size());
+             })
         .def_readonly("bit_count", &EncodedBlock::bit_count);
 
     py::class_<IFSEEncoder>(m, "IFSEEncoder");
     py::class_<FSEEncoderMSB, IFSEEncoder>(m, "FSEEncoder")
         .def(py::init<const FSETables&>())
+        // buffer overload first: bytes/memoryview/uint8 ndarrays of dense
+        // symbol ids are copied with one memcpy instead of being unpacked
+        // element by element by the vector caster below
+        .def("encode_block",
+             [](const FSEEncoderMSB& enc, py::buffer symbols) {
+                 py::buffer_info info = symbols.request();
+                 if (info.ndim != 1 || info.itemsize != 1) {
+                     throw py::value_error("expected a contiguous byte buffer");
+                 }
+                 const uint8_t* p = static_cast<const uint8_t*>(info.ptr);
+                 std::vector<uint8_t> ids(p, p + info.size);
+                 py::gil_scoped_release release;
+                 return enc.encode_block(ids);
+             })
         .def("encode_block",
              [](const FSEEncoderMSB& enc, const std::vector<uint8_t>& symbols) {
+                 py::gil_scoped_release release;
                  return enc.encode_block(symbols);
+             })
+        // Fused path for byte alphabets: reads the raw data buffer and maps
+        // each byte through a 256-entry int16 LUT (negative = not in
+        // alphabet) in one C loop, so no mapped copy is built on the Python
+        // side at all
+        .def("encode_block_bytes",
+             [](const FSEEncoderMSB& enc, py::buffer src, py::buffer lut) {
+                 py::buffer_info s = src.request();
+                 py::buffer_info l = lut.request();
+                 if (s.ndim != 1 || s.itemsize != 1) {
+                     throw py::value_error("expected a contiguous byte buffer");
+                 }
+                 if (l.ndim != 1 || l.size != 256 || l.itemsize != 2) {
+                     throw py::value_error("expected a 256-entry int16 LUT");
+                 }
+                 const uint8_t* p = static_cast<const uint8_t*>(s.ptr);
+                 const int16_t* map = static_cast<const int16_t*>(l.ptr);
+                 std::vector<uint8_t> ids(static_cast<size_t>(s.size));
+                 bool bad_symbol = false;
+                 {
+                     // Pure native work from here on: mapping loop and encode
+                     // run without the GIL so batched encodes thread-scale
+                     py::gil_scoped_release release;
+                     for (size_t i = 0; i < ids.size(); ++i) {
+                         const int16_t id = map[p[i]];
+                         if (id < 0) {
+                             bad_symbol = true;
+                             break;
+                         }
+                         ids[i] = static_cast<uint8_t>(id);
+                     }
+                     if (!bad_symbol) {
+                         return enc.encode_block(ids);
+                     }
+                 }
+                 throw py::value_error("symbol not in alphabet");
+             })
+        // Batched entry point: encodes a sequence of byte buffers of dense
+        // symbol ids in one FFI call, holding the GIL only while the buffer
+        // views are collected and the results are converted back
+        .def("encode_blocks",
+             [](const FSEEncoderMSB& enc, py::sequence srcs) {
+                 std::vector<py::buffer_info> infos;
+                 infos.reserve(py::len(srcs));
+                 for (auto item : srcs) {
+                     py::buffer_info info = item.cast<py::buffer>().request();
+                     if (info.ndim != 1 || info.itemsize != 1) {
+                         throw py::value_error(
+                             "expected contiguous byte buffers");
+                     }
+                     infos.push_back(std::move(info));
+                 }
+                 std::vector<EncodedBlock> out;
+                 out.reserve(infos.size());
+                 {
+                     py::gil_scoped_release release;
+                     for (const py::buffer_info& info : infos) {
+                         const uint8_t* p =
+                             static_cast<const uint8_t*>(info.ptr);
+                         out.push_back(enc.encode_block(
+                             std::vector<uint8_t>(p, p + info.size)));
+                     }
+                 }
+                 return out;
              });
 
     py::class_<DecodeResult>(m, "DecodeResult")
@@ -51,9 +136,42 @@ PYBIND11_MODULE(scl_fse_cpp, m) {
     py::class_<IFSEDecoder>(m, "IFSEDecoder");
     py::class_<FSEDecoderMSB, IFSEDecoder>(m, "FSEDecoder")
         .def(py::init<const FSETables&>())
+        // buffer overload first: bytes/memoryview inputs are read in place
+        // through the buffer protocol, with no per-byte unboxing
+        .def("decode_block",
+             [](const FSEDecoderMSB& dec, py::buffer buf, size_t bit_count) {
+                 py::buffer_info info = buf.request();
+                 if (info.ndim != 1 || info.itemsize != 1) {
+                     throw py::value_error("expected a contiguous byte buffer");
+                 }
+                 // bit_count gives the exact payload length when the caller
+                 // knows it; 0 falls back to the padded byte length
+                 const size_t bit_len =
+                     bit_count ? bit_count
+                               : static_cast<size_t>(info.size) * 8;
+                 if (bit_len > static_cast<size_t>(info.size) * 8) {
+                     throw py::value_error("bit_count exceeds buffer length");
+                 }
+                 DecodeResult res;
+                 {
+                     py::gil_scoped_release release;
+                     res = dec.decode_block(
+                         static_cast<const uint8_t*>(info.ptr), bit_len);
+                 }
+                 // Return ids as bytes (one memcpy) so the Python side can
+                 // map them back to symbols with a vectorized gather
+                 py::bytes ids(reinterpret_cast<const char*>(res.symbols.data()),
+                               res.symbols.size());
+                 return py::make_tuple(ids, res.bits_consumed);
+             },
+             py::arg("buf"), py::arg("bit_count") = 0)
         .def("decode_block",
              [](const FSEDecoderMSB& dec, const std::vector<uint8_t>& bytes) {
-                 DecodeResult res = dec.decode_block(bytes.data(), bytes.size() * 8);
+                 DecodeResult res;
+                 {
+                     py::gil_scoped_release release;
+                     res = dec.decode_block(bytes.data(), bytes.size() * 8);
+                 }
                  return py::make_tuple(res.symbols, res.bits_consumed);
              });
 
@@ -5,8 +5,11 @@ This implementation follows the baseline FSE algorithm as described in
 Yann Collet's blogs.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Tuple, Any, List, Dict
+
+import numpy as np
 from scl.core.data_encoder_decoder import DataDecoder, DataEncoder
 from scl.utils.bitarray_utils import (
     BitArray,
@@ -16,13 +19,23 @@ from scl.utils.bitarray_utils import (
 from scl.core.data_block import DataBlock
 from scl.core.prob_dist import Frequencies
 
+# Numba is optional: when available the encode/decode inner loops run as
+# compiled kernels over the flat ndarray tables, otherwise the pure-Python
+# loops below are used
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NUMBA_AVAILABLE = False
+
 
 def floor_log2(x: int) -> int:
     """Compute floor(log2(x)) for x > 0"""
     return x.bit_length() - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodeEntry:
     """Decode table entry: maps state to (symbol, nb_bits, new_state_base)"""
 
@@ -31,7 +44,7 @@ class DecodeEntry:
     new_state_base: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SymTransform:
     """Symbol transform for encoding: (delta_nb_bits, delta_find_state)"""
 
@@ -39,25 +52,42 @@ class SymTransform:
     delta_find_state: int
 
 
-@dataclass
 class FSEParams:
     """Parameters for FSE encoder/decoder
 
     FSE uses a table-based approach where the table size is a power of 2.
     Frequencies are normalized to fit this table size.
-    """
 
-    freqs: Frequencies
-
-    # Number of bits to encode data block size
-    DATA_BLOCK_SIZE_BITS: int = 32
+    A plain class (not a dataclass): all fields, including the derived ones,
+    are ordinary instance attributes assigned once here.
+    """
 
-    # Table size is 2^TABLE_SIZE_LOG2
-    # Default: 12 (4096 states)
-    # trades off compression for memory usage
-    TABLE_SIZE_LOG2: int = 12
+    __slots__ = (
+        "freqs",
+        "DATA_BLOCK_SIZE_BITS",
+        "TABLE_SIZE_LOG2",
+        "TABLE_SIZE",
+        "normalized_freqs",
+        "INITIAL_STATE",
+        "_spread_table",
+    )
+
+    def __init__(
+        self,
+        freqs: Frequencies,
+        DATA_BLOCK_SIZE_BITS: int = 32,
+        TABLE_SIZE_LOG2: int = 12,
+    ):
+        self.freqs = freqs
+
+        # Number of bits to encode data block size
+        self.DATA_BLOCK_SIZE_BITS = DATA_BLOCK_SIZE_BITS
+
+        # Table size is 2^TABLE_SIZE_LOG2
+        # Default: 12 (4096 states)
+        # trades off compression for memory usage
+        self.TABLE_SIZE_LOG2 = TABLE_SIZE_LOG2
 
-    def __post_init__(self):
         # Table size must be power of 2 for FSE state space
         self.TABLE_SIZE = 1 << self.TABLE_SIZE_LOG2
 
@@ -70,10 +100,26 @@ class FSEParams:
         # Initial encoder state = table_size (FSE convention: encoder state in [table_size, 2*table_size))
         self.INITIAL_STATE = self.TABLE_SIZE
 
+        # Lazily-built spread table, shared by encoder and decoder (see get_spread_table)
+        self._spread_table = None
+
+    def get_spread_table(self) -> List[Any]:
+        """Return the spread table for these params, building it at most once
+
+        The spread table is deterministic in (normalized_freqs, TABLE_SIZE_LOG2),
+        so an encoder and decoder constructed from the same params can share a
+        single copy instead of each rebuilding it.
+        """
+        if self._spread_table is None:
+            self._spread_table = get_fse_tables(self)[0]
+        return self._spread_table
+
     def _normalize_frequencies(self) -> Dict[Any, int]:
         """Normalize frequencies to sum to TABLE_SIZE
 
-        Uses simple proportional scaling with rounding adjustment.
+        Uses simple proportional scaling with rounding adjustment. The scaling
+        runs as array arithmetic over the whole alphabet (one multiply/rint
+        pass) rather than per-symbol Python calls.
         """
         table_size = self.TABLE_SIZE
         total = self.freqs.total_freq
@@ -82,53 +128,57 @@ class FSEParams:
             raise ValueError("empty distribution")
 
         # Initial proportional allocation: scale each frequency proportionally
-        norm = {}
-        allocated = 0
-
-        for s in self.freqs.alphabet:
-            c = self.freqs.frequency(s)
-            if c == 0:
-                norm[s] = 0
-                continue
-
-            x = c * table_size / total
-            n = max(1, int(round(x)))
-            norm[s] = n
-            allocated += n
-
-        # Fix rounding errors: adjust frequencies to sum exactly to table_size
-        diff = table_size - allocated
-        if diff != 0:
-            # Sort by frequency (descending) to prioritize high-frequency symbols
-            sorted_syms = sorted(
-                self.freqs.alphabet, key=lambda s: self.freqs.frequency(s), reverse=True
-            )
-            i = 0
-            step = 1 if diff > 0 else -1
-            while diff != 0 and i < len(sorted_syms):
-                s = sorted_syms[i]
-                if norm[s] + step > 0:  # keep strictly positive
-                    norm[s] += step
-                    diff -= step
-                else:
-                    i += 1
-
-        return norm
+        # (every present symbol keeps at least one slot)
+        # Snapshot counts straight from the dict values (same order as the
+        # alphabet) instead of calling freqs.frequency(s) per symbol
+        syms = self.freqs.alphabet
+        f = np.fromiter(
+            self.freqs.freq_dict.values(), dtype=np.float64, count=len(syms)
+        )
+        scaled = np.rint(f * (table_size / total)).astype(np.int64)
+        scaled[(f > 0) & (scaled < 1)] = 1
+        scaled[f == 0] = 0
+
+        # Fix rounding errors: adjust frequencies to sum exactly to table_size,
+        # dumping the difference onto the highest-frequency symbols first
+        # (keeping every count strictly positive)
+        diff = table_size - int(scaled.sum())
+        if diff > 0:
+            # Surplus goes entirely to the highest-frequency symbol
+            scaled[np.argsort(-f, kind="stable")[0]] += diff
+        elif diff < 0:
+            # Deficit is taken from the highest-frequency symbols, each kept
+            # strictly positive, in one pass instead of unit decrements
+            for i in np.argsort(-f, kind="stable"):
+                take = min(-diff, int(scaled[i]) - 1)
+                if take > 0:
+                    scaled[i] -= take
+                    diff += take
+                if diff == 0:
+                    break
+
+        return dict(zip(syms, scaled.tolist()))
 
 
 class BitReader:
-    """Bit reader for decoding"""
+    """Bit reader for decoding
+
+    Converts the bitstream to a single int up front and reads via shift+mask
+    with a bit cursor, instead of slicing the BitArray per read (each slice
+    copies the requested bits and allocates a new BitArray).
+    """
 
     def __init__(self, bits: BitArray):
         self.bits = bits
         self.pos = 0  # bit position from left
+        self._stream_int = bitarray_to_uint(bits) if len(bits) > 0 else 0
+        self._total_bits = len(bits)
 
     def read_bits(self, n: int) -> int:
         """Read n bits from current position (MSB-first, left to right)"""
         if n == 0:
             return 0
-        # Read bits starting at pos, convert to integer (MSB-first)
-        v = bitarray_to_uint(self.bits[self.pos : self.pos + n])
+        v = (self._stream_int >> (self._total_bits - self.pos - n)) & ((1 << n) - 1)
         self.pos += n
         return v
 
@@ -148,42 +198,22 @@ def build_spread_table(norm_freq: Dict[Any, int], table_log: int) -> List[Any]:
     """
     table_size = 1 << table_log
     table_mask = table_size - 1
-    spread = [None] * table_size
     # FSE step formula: ensures step is odd and co-prime with table_size
     step = (table_size >> 1) + (table_size >> 3) + 3
 
-    # Build list of symbols, each appearing according to its normalized frequency
-    syms = []
-    for s, freq in norm_freq.items():
-        syms.extend([s] * freq)
-
-    # Use FSE spread algorithm: place symbols using step pattern
-    pos = 0
-    for s in syms:
-        start_pos = pos
-        attempts = 0
-        while spread[pos] is not None:
-            pos = (pos + step) & table_mask  # Wrap around using mask
-            attempts += 1
-            if attempts >= table_size or pos == start_pos:
-                # Fallback: find any empty position if step pattern fails
-                found = False
-                for i in range(table_size):
-                    if spread[i] is None:
-                        spread[i] = s
-                        pos = (i + step) & table_mask
-                        found = True
-                        break
-                if not found:
-                    # This should never happen if frequencies sum correctly
-                    raise ValueError(f"Cannot find empty position for symbol {s}")
-                break
-        else:
-            spread[pos] = s
-            pos = (pos + step) & table_mask
-
-    assert all(x is not None for x in spread), "Spread table must be fully populated"
-    return spread
+    # Use FSE spread algorithm: place symbols using step pattern.
+    # step is odd and table_size is a power of two, so they are co-prime and
+    # the step-walk positions form a permutation of the table: computing them
+    # with one arange multiply and scattering the repeated symbol ids fills
+    # every slot, all at C level
+    symbols = list(norm_freq)
+    freq_arr = np.fromiter(norm_freq.values(), dtype=np.int64, count=len(symbols))
+    positions = (np.arange(table_size, dtype=np.int64) * step) & table_mask
+    spread_ids = np.empty(table_size, dtype=np.int64)
+    spread_ids[positions] = np.repeat(np.arange(len(symbols)), freq_arr)
+    # Full population is structural: the positions form a permutation, so
+    # every slot receives exactly one id and no completeness scan is needed
+    return [symbols[i] for i in spread_ids.tolist()]
 
 
 def build_decode_table(
@@ -205,28 +235,45 @@ def build_decode_table(
         List of DecodeEntry, one per state
     """
     table_size = 1 << table_log
-    D = [None] * table_size
-    # Track next encoder state for each symbol (starts at normalized frequency)
-    symbol_next = {s: norm_freq[s] for s in norm_freq}
-
-    for u in range(table_size):
-        s = spread[u]
-        # Encoder state is in [table_size, 2*table_size)
-        next_state_enc = symbol_next[s]
-        symbol_next[s] += 1
-
-        # Compute nb_bits: number of bits to read, chosen so average matches Shannon code length
-        nb_bits = table_log - floor_log2(next_state_enc)
-        # Compute base for new decoder state (decoder state is in [0, table_size))
-        new_state_base = (next_state_enc << nb_bits) - table_size
-
-        assert (
-            0 <= new_state_base < table_size
-        ), f"New state base {new_state_base} not in [0, {table_size})"
-
-        D[u] = DecodeEntry(symbol=s, nb_bits=nb_bits, new_state_base=new_state_base)
-
-    return D
+    symbols = list(norm_freq)
+    sym_id = {s: i for i, s in enumerate(symbols)}
+    freq_arr = np.fromiter(norm_freq.values(), dtype=np.int64, count=len(symbols))
+    spread_ids = np.fromiter(
+        (sym_id[s] for s in spread), dtype=np.int64, count=table_size
+    )
+
+    # Occurrence rank of each symbol within the spread table (0 for its first
+    # slot, 1 for its second, ...), computed with a stable argsort instead of
+    # a per-state dict of running counters
+    group_starts = np.zeros(len(symbols), dtype=np.int64)
+    group_starts[1:] = np.cumsum(freq_arr)[:-1]
+    ranks = np.empty(table_size, dtype=np.int64)
+    ranks[np.argsort(spread_ids, kind="stable")] = np.arange(table_size) - np.repeat(
+        group_starts, freq_arr
+    )
+
+    # Encoder state is in [table_size, 2*table_size); next state for the k-th
+    # occurrence of a symbol is norm_freq[s] + k
+    next_state_enc = freq_arr[spread_ids] + ranks
+
+    # nb_bits: number of bits to read, chosen so average matches Shannon code length
+    # (frexp exponent - 1 == floor_log2, exact for integers)
+    nb_bits = table_log - (np.frexp(next_state_enc.astype(np.float64))[1] - 1)
+    # Base for new decoder state (decoder state is in [0, table_size))
+    new_state_base = (next_state_enc << nb_bits) - table_size
+
+    assert (
+        (new_state_base >= 0) & (new_state_base < table_size)
+    ).all(), f"New state bases must be in [0, {table_size})"
+
+    return [
+        DecodeEntry(
+            symbol=spread[u],
+            nb_bits=int(nb_bits[u]),
+            new_state_base=int(new_state_base[u]),
+        )
+        for u in range(table_size)
+    ]
 
 
 def build_encode_table(
@@ -247,22 +294,18 @@ def build_encode_table(
     table_size = 1 << table_log
     symbols = list(norm_freq.keys())
 
-    # Compute cumulative start index per symbol
-    cumul = {}
-    acc = 0
-    for s in symbols:
-        cumul[s] = acc
-        acc += norm_freq[s]
-    assert acc == table_size
-
-    # Build tableU16: maps subrange_id to next encoder state (in [table_size, 2*table_size))
-    tableU16 = [0] * table_size
-    local_cumul = cumul.copy()
-    for u, s in enumerate(spread):
-        tableU16[local_cumul[s]] = (
-            table_size + u
-        )  # Encoder state = table_size + decoder state
-        local_cumul[s] += 1
+    # Build tableU16: maps subrange_id to next encoder state (in [table_size, 2*table_size)).
+    # Slot cumul[s] + k holds the encoder state for the k-th occurrence of s in
+    # the spread table; a stable argsort of the spread symbol ids orders table
+    # positions exactly by (symbol, occurrence), so the whole table is
+    # table_size + argsort, with no per-state dict of running cursors
+    sym_id = {s: i for i, s in enumerate(symbols)}
+    spread_ids = np.fromiter(
+        (sym_id[s] for s in spread), dtype=np.int64, count=table_size
+    )
+    tableU16 = (
+        table_size + np.argsort(spread_ids, kind="stable")
+    ).tolist()  # Encoder state = table_size + decoder state
 
     # Build symbolTT: per-symbol transforms for encoding
     symbolTT = {}
@@ -275,8 +318,9 @@ def build_encode_table(
             symbolTT[s] = SymTransform(delta_nb_bits, 0)
             continue
 
-        # Compute max bits output for this symbol
-        max_bits_out = table_log - floor_log2(freq - 1)
+        # Compute max bits output for this symbol (bit_length - 1 == floor_log2,
+        # inlined to skip the call frame per symbol)
+        max_bits_out = table_log - ((freq - 1).bit_length() - 1)
         min_state_plus = freq << max_bits_out
         # delta_nb_bits encodes both max_bits_out (high 16 bits) and min_state_plus (low 16 bits)
         delta_nb_bits = (max_bits_out << 16) - min_state_plus
@@ -289,6 +333,170 @@ def build_encode_table(
     return tableU16, symbolTT
 
 
+@functools.lru_cache(maxsize=32)
+def _build_tables_cached(norm_freq_items: Tuple, table_log: int):
+    """Build (spread, DTable, tableU16, symbolTT) once per distinct distribution
+
+    Benchmark drivers construct a fresh encoder/decoder per file, so files with
+    identical normalized frequencies would otherwise rebuild the same tables
+    from scratch. Keyed on the normalized frequency items (hashable tuple) and
+    table size; none of the returned tables are mutated by the codecs.
+    """
+    norm_freq = dict(norm_freq_items)
+    spread = build_spread_table(norm_freq, table_log)
+    DTable = build_decode_table(spread, norm_freq, table_log)
+    tableU16, symbolTT = build_encode_table(spread, norm_freq, table_log)
+    return spread, DTable, tableU16, symbolTT
+
+
+def get_fse_tables(fse_params: "FSEParams"):
+    """Return the cached (spread, DTable, tableU16, symbolTT) for fse_params"""
+    return _build_tables_cached(
+        tuple(fse_params.normalized_freqs.items()), fse_params.TABLE_SIZE_LOG2
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _build_encoder_arrays_cached(norm_freq_items: Tuple, table_log: int):
+    """Flat encoder-side arrays derived from the cached tables
+
+    Everything the encoder hot path touches - int32 tableU16, dense symbol
+    ids, delta arrays, the packed ENC table and the byte LUT - is built here
+    once per distribution so repeated FSEEncoder construction just binds
+    references.
+    """
+    norm_freq = dict(norm_freq_items)
+    table_size = 1 << table_log
+    _, _, tableU16, symbolTT = _build_tables_cached(norm_freq_items, table_log)
+
+    tableU16 = np.asarray(tableU16, dtype=np.int32)
+    sym_idx = {s: i for i, s in enumerate(norm_freq)}
+    delta_nb_bits = np.array(
+        [symbolTT[s].delta_nb_bits for s in norm_freq], dtype=np.int32
+    )
+    delta_find_state = np.array(
+        [symbolTT[s].delta_find_state for s in norm_freq], dtype=np.int32
+    )
+
+    # Collapse symbolTT + tableU16 into one dense per-(symbol, state) table:
+    # packed = (new_state << 16) | nb_out, indexed by [sym_id, state - table_size].
+    # encode_symbol then needs a single table load instead of the delta
+    # arithmetic plus two indirections.
+    states = np.arange(table_size, 2 * table_size, dtype=np.int64)
+    ENC = np.empty((len(sym_idx), table_size), dtype=np.int64)
+    for i in range(len(sym_idx)):
+        nb = (states + int(delta_nb_bits[i])) >> 16
+        new_state = tableU16[(states >> nb) + int(delta_find_state[i])]
+        ENC[i] = (new_state.astype(np.int64) << 16) | nb
+
+    # Dense byte -> id LUT when the alphabet is raw bytes (0-255), so a
+    # uint8 data block maps to symbol ids with one vectorized gather
+    if all(isinstance(s, (int, np.integer)) and 0 <= s < 256 for s in norm_freq):
+        byte_lut = np.full(256, -1, dtype=np.int64)
+        for s, i in sym_idx.items():
+            byte_lut[s] = i
+    else:
+        byte_lut = None
+
+    return tableU16, sym_idx, delta_nb_bits, delta_find_state, ENC, byte_lut
+
+
+@functools.lru_cache(maxsize=32)
+def _build_decoder_arrays_cached(norm_freq_items: Tuple, table_log: int):
+    """Flat decoder-side arrays (dense symbol ids, bit counts, state bases)"""
+    norm_freq = dict(norm_freq_items)
+    _, DTable, _, _ = _build_tables_cached(norm_freq_items, table_log)
+
+    sym_idx = {s: i for i, s in enumerate(norm_freq)}
+    id_to_sym = list(norm_freq)
+    D_sym = np.array([sym_idx[e.symbol] for e in DTable], dtype=np.int32)
+    D_nb = np.array([e.nb_bits for e in DTable], dtype=np.int32)
+    D_base = np.array([e.new_state_base for e in DTable], dtype=np.int32)
+    return sym_idx, id_to_sym, D_sym, D_nb, D_base
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _fse_encode_kernel(
+        sym_ids,
+        tableU16,
+        delta_nb_bits,
+        delta_find_state,
+        table_size,
+        table_log,
+        size_bits,
+        out_buf,
+    ):  # pragma: no cover (compiled)
+        """Compiled encode loop: writes the bitstream back-to-front into out_buf
+
+        Bits are packed into an int accumulator and flushed a byte at a time
+        from the end of out_buf (the stream is built in reverse, so the tail
+        bytes are known first). Returns (pos, acc, nbits) where out_buf[pos:]
+        holds the whole bytes and acc holds the nbits leading bits.
+        """
+        state = table_size
+        acc = 0
+        nbits = 0
+        pos = out_buf.shape[0]
+        for i in range(sym_ids.shape[0] - 1, -1, -1):
+            s = sym_ids[i]
+            nb = (state + delta_nb_bits[s]) >> 16
+            acc |= (state & ((1 << nb) - 1)) << nbits
+            nbits += nb
+            state = tableU16[(state >> nb) + delta_find_state[s]]
+            while nbits >= 8:
+                pos -= 1
+                out_buf[pos] = acc & 0xFF
+                acc >>= 8
+                nbits -= 8
+
+        # Prepend final state offset, then the block size header
+        acc |= (state - table_size) << nbits
+        nbits += table_log
+        acc |= sym_ids.shape[0] << nbits
+        nbits += size_bits
+        while nbits >= 8:
+            pos -= 1
+            out_buf[pos] = acc & 0xFF
+            acc >>= 8
+            nbits -= 8
+        return pos, acc, nbits
+
+    @njit(cache=True)
+    def _fse_decode_kernel(
+        stream_bytes, start_bit, block_size, D_sym, D_nb, D_base, state, out_ids
+    ):  # pragma: no cover (compiled)
+        """Compiled decode loop: reads symbol bits through a byte-refilled window
+
+        stream_bytes is the whole encoded bitstream as bytes; reading starts at
+        bit offset start_bit (MSB-first). Decoded dense symbol ids are written
+        into out_ids. Returns (final_state, bits_consumed_by_symbols).
+        """
+        byte_pos = start_bit >> 3
+        acc = 0
+        acc_bits = 0
+        rem = start_bit & 7
+        if rem:
+            acc = stream_bytes[byte_pos] & ((1 << (8 - rem)) - 1)
+            acc_bits = 8 - rem
+            byte_pos += 1
+
+        consumed = 0
+        for i in range(block_size):
+            out_ids[i] = D_sym[state]
+            nb = D_nb[state]
+            while acc_bits < nb:
+                acc = (acc << 8) | stream_bytes[byte_pos]
+                byte_pos += 1
+                acc_bits += 8
+            acc_bits -= nb
+            bits = (acc >> acc_bits) & ((1 << nb) - 1)
+            state = D_base[state] + bits
+            consumed += nb
+        return state, consumed
+
+
 class FSEEncoder(DataEncoder):
     """FSE Encoder"""
 
@@ -298,11 +506,42 @@ class FSEEncoder(DataEncoder):
         self.table_size = fse_params.TABLE_SIZE
         self.DATA_BLOCK_SIZE_BITS = fse_params.DATA_BLOCK_SIZE_BITS
 
-        norm_freq = fse_params.normalized_freqs
-        self.spread_table = build_spread_table(norm_freq, self.table_log)
-        self.DTable = build_decode_table(self.spread_table, norm_freq, self.table_log)
-        self.tableU16, self.symbolTT = build_encode_table(
-            self.spread_table, norm_freq, self.table_log
+        # The encoder only needs the spread table and symbol transforms; the
+        # decode table belongs to FSEDecoder
+        self.spread_table, _, _, self.symbolTT = get_fse_tables(fse_params)
+
+        # Bind the cached flat hot-path arrays (built once per distribution):
+        # dict lookup + dataclass attribute access per symbol becomes a
+        # single C-level array read indexed by dense symbol id
+        (
+            self.tableU16,
+            self.sym_idx,
+            self.delta_nb_bits,
+            self.delta_find_state,
+            self.ENC,
+            self.byte_lut,
+        ) = _build_encoder_arrays_cached(
+            tuple(fse_params.normalized_freqs.items()), self.table_log
+        )
+
+        # Scratch output buffer for encode_block, grown on demand and reused
+        # across blocks (the bitstream is copied out before returning)
+        self._out_buf = None
+
+    def _symbols_to_ids(self, symbols) -> np.ndarray:
+        """Map a block of symbols to dense symbol ids for the compiled kernel"""
+        if (
+            self.byte_lut is not None
+            and isinstance(symbols, np.ndarray)
+            and symbols.dtype == np.uint8
+        ):
+            ids = self.byte_lut[symbols]
+            if ids.size > 0 and ids.min() < 0:
+                raise ValueError("data block contains symbols not in the alphabet")
+            return ids
+        sym_idx = self.sym_idx
+        return np.fromiter(
+            (sym_idx[s] for s in symbols), dtype=np.int64, count=len(symbols)
         )
 
     def encode_symbol(self, state: int, s: Any) -> Tuple[int, int, int]:
@@ -315,50 +554,80 @@ class FSEEncoder(DataEncoder):
         Returns:
             (new_state, nb_bits_out, out_bits_value)
         """
-        tt = self.symbolTT[s]
-        # Extract number of bits to output
-        nb_out = (state + tt.delta_nb_bits) >> 16
+        # One dense table load gives both the bit count and the next state
+        packed = int(self.ENC[self.sym_idx[s], state - self.table_size])
+        nb_out = packed & 0xFF
+        new_state = packed >> 16
         # Extract low nb_out bits from state to output
-        out_mask = (1 << nb_out) - 1
-        out_bits_value = state & out_mask
-        # Compute subrange_id and look up next state
-        subrange_id = state >> nb_out
-        new_state = self.tableU16[subrange_id + tt.delta_find_state]
+        out_bits_value = state & ((1 << nb_out) - 1)
         return new_state, nb_out, out_bits_value
 
     def encode_block(self, data_block: DataBlock) -> BitArray:
         """Encode a block of data"""
-        symbols = list(data_block.data_list)
+        symbols = data_block.data_list
         block_size = len(symbols)
 
         # Handle empty block: still encode block size (0)
-        if not symbols:
+        if block_size == 0:
             return uint_to_bitarray(0, bit_width=self.DATA_BLOCK_SIZE_BITS)
 
+        if _NUMBA_AVAILABLE:
+            sym_ids = self._symbols_to_ids(symbols)
+            # Worst-case output: (table_log + 1) bits per symbol plus headers
+            max_bytes = (
+                self.DATA_BLOCK_SIZE_BITS
+                + self.table_log
+                + block_size * (self.table_log + 1)
+            ) // 8 + 8
+            buf = self._out_buf
+            if buf is None or buf.shape[0] < max_bytes:
+                buf = self._out_buf = np.empty(max_bytes, dtype=np.uint8)
+            pos, acc, nbits = _fse_encode_kernel(
+                sym_ids,
+                self.tableU16,
+                self.delta_nb_bits,
+                self.delta_find_state,
+                self.table_size,
+                self.table_log,
+                self.DATA_BLOCK_SIZE_BITS,
+                buf,
+            )
+            bits = (
+                uint_to_bitarray(int(acc), bit_width=int(nbits))
+                if nbits
+                else BitArray()
+            )
+            bits.frombytes(buf[pos:].tobytes())
+            return bits
+
         # FSE encodes in reverse order (last symbol first)
         state = self.table_size
 
-        # Encode from last symbol to first (reverse order)
-        bits = BitArray("")
-        for s in reversed(symbols):
-            state, nb_out, out_bits_value = self.encode_symbol(state, s)
+        # Encode from last symbol to first (reverse order).
+        # Output bits are accumulated in a single int (prepending a value of
+        # width w is `acc |= value << nbits`), avoiding the O(N^2) cost of
+        # concatenating a growing BitArray per symbol. The int is serialized
+        # to a BitArray exactly once at the end.
+        acc = 0
+        nbits = 0
+        encode_symbol = self.encode_symbol  # hoist the bound-method lookup
+        for i in range(block_size - 1, -1, -1):
+            state, nb_out, out_bits_value = encode_symbol(state, symbols[i])
             if nb_out > 0:
-                # Prepend bits since we're encoding backwards
-                bits = uint_to_bitarray(out_bits_value, bit_width=nb_out) + bits
+                acc |= out_bits_value << nbits
+                nbits += nb_out
 
         # Store final state offset (encoder state is in [table_size, 2*table_size))
         # Offset is in [0, table_size), encoded with table_log bits
         state_offset = state - self.table_size
-        final_state_bits = uint_to_bitarray(state_offset, bit_width=self.table_log)
-        bits = final_state_bits + bits
+        acc |= state_offset << nbits
+        nbits += self.table_log
 
         # Prepend block size header (encoded with DATA_BLOCK_SIZE_BITS)
-        block_size_bits = uint_to_bitarray(
-            block_size, bit_width=self.DATA_BLOCK_SIZE_BITS
-        )
-        bits = block_size_bits + bits
+        acc |= block_size << nbits
+        nbits += self.DATA_BLOCK_SIZE_BITS
 
-        return bits
+        return uint_to_bitarray(acc, bit_width=nbits)
 
 
 class FSEDecoder(DataDecoder):
@@ -375,59 +644,88 @@ class FSEDecoder(DataDecoder):
         self.table_size = fse_params.TABLE_SIZE
         self.DATA_BLOCK_SIZE_BITS = fse_params.DATA_BLOCK_SIZE_BITS
 
-        norm_freq = fse_params.normalized_freqs
-        self.spread_table = build_spread_table(norm_freq, self.table_log)
-        self.DTable = build_decode_table(self.spread_table, norm_freq, self.table_log)
+        self.spread_table, self.DTable, _, _ = get_fse_tables(fse_params)
+
+        # Bind the cached parallel decode arrays (dense symbol ids / bit
+        # counts / state bases), built once per distribution
+        (
+            self.sym_idx,
+            self.id_to_sym,
+            self.D_sym,
+            self.D_nb,
+            self.D_base,
+        ) = _build_decoder_arrays_cached(
+            tuple(fse_params.normalized_freqs.items()), self.table_log
+        )
 
     def decode_symbol(self, state: int, bitreader: BitReader) -> Tuple[Any, int]:
         """Decode one symbol: lookup in decode table, read bits, compute next state"""
-        entry = self.DTable[state]  # Decoder state is in [0, table_size)
-        s = entry.symbol
-        nb = entry.nb_bits  # Number of bits to read (variable, depends on state)
+        # Decoder state is in [0, table_size); read the flat parallel arrays
+        # instead of chasing a DecodeEntry heap object per state
+        s = self.id_to_sym[self.D_sym[state]]
+        # Number of bits to read (variable, depends on state)
+        nb = int(self.D_nb[state])
         bits = bitreader.read_bits(nb)
         # Next state = base + read bits (both in [0, table_size))
-        new_state = entry.new_state_base + bits
+        new_state = int(self.D_base[state]) + bits
         return s, new_state
 
     def decode_block(self, encoded_bitarray: BitArray) -> Tuple[DataBlock, int]:
         """Decode a block of data"""
-        num_bits_consumed = 0
-
         if len(encoded_bitarray) < self.DATA_BLOCK_SIZE_BITS:
             return DataBlock([]), 0
 
+        if _NUMBA_AVAILABLE:
+            header_bits = self.DATA_BLOCK_SIZE_BITS
+            block_size = bitarray_to_uint(encoded_bitarray[:header_bits])
+            if block_size == 0:
+                return DataBlock([]), header_bits
+            state = bitarray_to_uint(
+                encoded_bitarray[header_bits : header_bits + self.table_log]
+            )
+            start_bit = header_bits + self.table_log
+
+            stream_bytes = np.frombuffer(encoded_bitarray.tobytes(), dtype=np.uint8)
+            out_ids = np.empty(block_size, dtype=np.int64)
+            state, consumed = _fse_decode_kernel(
+                stream_bytes,
+                start_bit,
+                block_size,
+                self.D_sym,
+                self.D_nb,
+                self.D_base,
+                state,
+                out_ids,
+            )
+            assert state == 0, f"Final decode state {state} != initial decode state 0"
+            id_to_sym = self.id_to_sym
+            result = [id_to_sym[i] for i in out_ids.tolist()]
+            return DataBlock(result), start_bit + consumed
+
+        # One reader over the whole bitstream: headers and symbol bits are all
+        # read through the int cursor, no per-step BitArray slicing
+        bitreader = BitReader(encoded_bitarray)
+
         # Read block size
-        block_size_bits = encoded_bitarray[: self.DATA_BLOCK_SIZE_BITS]
-        block_size = (
-            bitarray_to_uint(block_size_bits) if len(block_size_bits) > 0 else 0
-        )
-        num_bits_consumed += self.DATA_BLOCK_SIZE_BITS
+        block_size = bitreader.read_bits(self.DATA_BLOCK_SIZE_BITS)
 
         if block_size == 0:
-            return DataBlock([]), num_bits_consumed
+            return DataBlock([]), bitreader.pos
 
         # Read final state offset (decoder state is in [0, table_size))
         # Offset was encoded with table_log bits, decoder uses it directly as initial state
-        final_state_bits = encoded_bitarray[
-            num_bits_consumed : num_bits_consumed + self.table_log
-        ]
-        state_offset = bitarray_to_uint(final_state_bits)
-        state = state_offset  # Decoder starts at this state (encoder started at table_size, offset 0)
-        num_bits_consumed += self.table_log
-
-        # Set up bit reader for remaining bits
-        bitreader = BitReader(encoded_bitarray[num_bits_consumed:])
+        state = bitreader.read_bits(self.table_log)
 
         # Decode forward
         # When we encode in reverse order, the bits are written in reverse
         # When we decode forward, we read bits in forward order
         # The symbols come out in the correct order (not reversed)
-        result = []
-        for _ in range(block_size):
-            s, state = self.decode_symbol(state, bitreader)
-            result.append(s)
+        result = [None] * block_size
+        decode_symbol = self.decode_symbol  # hoist the bound-method lookup
+        for i in range(block_size):
+            s, state = decode_symbol(state, bitreader)
+            result[i] = s
 
         # Verify we end at state 0 (encoder started at table_size, offset 0)
         assert state == 0, f"Final decode state {state} != initial decode state 0"
-        num_bits_consumed += bitreader.pos
-        return DataBlock(result), num_bits_consumed
+        return DataBlock(result), bitreader.pos
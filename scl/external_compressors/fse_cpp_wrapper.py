@@ -1,9 +1,11 @@
 """Wrapper around the C++ FSE pybind module to mirror the Python codec API"""
 
+import functools
 import sys
 from pathlib import Path
 from typing import Any, List, Tuple
 
+import numpy as np
 from bitarray import bitarray
 
 from scl.core.data_block import DataBlock
@@ -32,6 +34,20 @@ else:
     _IMPORT_ERROR = None
 
 
+@functools.lru_cache(maxsize=32)
+def _build_cpp_tables(counts_vec: Tuple[int, ...], table_log: int):
+    """Build the C++ FSE params/tables once per distinct (counts, table_log)
+
+    Mirrors the Python codec's table cache: benchmark drivers and tests that
+    construct a fresh codec per block with identical frequencies reuse the
+    spread/state tables instead of rebuilding them in C++. The cached tables
+    are immutable once built and encoders/decoders only hold references.
+    """
+    params = scl_fse_cpp.FSEParams(list(counts_vec), table_log)
+    tables = scl_fse_cpp.FSETables(params)
+    return params, tables
+
+
 class _FSECppContext:
     """Shared state for the C++ encoder/decoder pair
     
@@ -47,31 +63,91 @@ class _FSECppContext:
                 "scl_fse_cpp module not available; build the pybind module"
             ) from _IMPORT_ERROR
 
-        # Build bidirectional mapping: symbol <-> dense integer ID
-        symbols = list(freqs.freq_dict.keys())
-        self._sym_to_id = {s: i for i, s in enumerate(symbols)}
-        self._id_to_sym = {i: s for s, i in self._sym_to_id.items()}
+        # Build the symbol <-> dense integer ID mapping and the count vector
+        # for the C++ API in one traversal of the frequency dict (ids follow
+        # dict insertion order, so counts_vec lines up positionally)
+        symbols: List[Any] = []
+        counts_vec: List[int] = []
+        self._sym_to_id = {}
+        for i, (sym, c) in enumerate(freqs.freq_dict.items()):
+            self._sym_to_id[sym] = i
+            symbols.append(sym)
+            counts_vec.append(c)
+
+        # IDs are dense 0..N-1, so the reverse map is just the symbol list
+        # indexed positionally - no hash probe per decoded symbol. The ndarray
+        # copy serves ids_to_symbols as a vectorized gather source.
+        self._id_to_sym = symbols
+        self._sym_arr = np.array(
+            symbols,
+            dtype=np.int64
+            if all(isinstance(s, (int, np.integer)) for s in symbols)
+            else object,
+        )
+
+        # Dense byte-indexed LUT when the alphabet is raw bytes (0-255): a
+        # uint8 data block then maps to ids with one vectorized gather instead
+        # of a dict lookup per symbol
+        if all(isinstance(s, (int, np.integer)) and 0 <= s < 256 for s in symbols):
+            lut = np.full(256, -1, dtype=np.int16)
+            for i, s in enumerate(symbols):
+                lut[s] = i
+            self._byte_lut = lut
+            # When the alphabet is exactly 0..N-1 in order, symbol == id and
+            # raw byte data needs no mapping at all
+            self._identity_byte_alphabet = all(
+                s == i for i, s in enumerate(symbols)
+            )
+        else:
+            self._byte_lut = None
+            self._identity_byte_alphabet = False
+
+        # Build FSE tables (shared between encoder and decoder, and cached
+        # across contexts with the same distribution)
+        self.params, self.tables = _build_cpp_tables(tuple(counts_vec), table_log)
 
-        # Convert symbol frequencies to dense count vector for C++ API
-        counts_vec = [0] * len(symbols)
-        for sym, c in freqs.freq_dict.items():
-            counts_vec[self._sym_to_id[sym]] = c
+    # Encoder/decoder are built on first use: a decode-only (or encode-only)
+    # workflow never pays for the other half
+    @functools.cached_property
+    def encoder(self):
+        return scl_fse_cpp.FSEEncoder(self.tables)
 
-        # Build FSE tables (shared between encoder and decoder)
-        self.params = scl_fse_cpp.FSEParams(counts_vec, table_log)
-        self.tables = scl_fse_cpp.FSETables(self.params)
-        self.encoder = scl_fse_cpp.FSEEncoder(self.tables)
-        self.decoder = scl_fse_cpp.FSEDecoder(self.tables)
+    @functools.cached_property
+    def decoder(self):
+        return scl_fse_cpp.FSEDecoder(self.tables)
 
-    def map_symbols(self, data_block: DataBlock) -> List[int]:
-        """Convert Python symbols to dense integer IDs for C++ encoder"""
+    def map_symbols(self, data_block: DataBlock):
+        """Convert Python symbols to dense integer IDs for C++ encoder
+
+        Byte-alphabet blocks backed by a uint8 ndarray map through the 256-entry
+        LUT in one gather and cross the pybind boundary as a bytes object (one
+        memcpy on the C++ side); other inputs fall back to the per-symbol dict.
+        """
+        data = data_block.data_list
+        if (
+            self._byte_lut is not None
+            and isinstance(data, np.ndarray)
+            and data.dtype == np.uint8
+        ):
+            ids = self._byte_lut[data]
+            if ids.size > 0 and ids.min() < 0:
+                raise ValueError("data block contains symbols not in the alphabet")
+            return ids.astype(np.uint8).tobytes()
         try:
-            return [self._sym_to_id[s] for s in data_block.data_list]
+            return [self._sym_to_id[s] for s in data]
         except KeyError as e:
             raise ValueError(f"Symbol {e} not in alphabet") from e
 
-    def ids_to_symbols(self, ids: List[int]) -> List[Any]:
-        """Convert dense integer IDs back to Python symbols after C++ decode"""
+    def ids_to_symbols(self, ids) -> List[Any]:
+        """Convert dense integer IDs back to Python symbols after C++ decode
+
+        The buffer-protocol decode path hands ids back as bytes; those map
+        through one NumPy gather. Plain id lists index the symbol list.
+        """
+        if isinstance(ids, (bytes, bytearray)):
+            ids = np.frombuffer(ids, dtype=np.uint8)
+        if isinstance(ids, np.ndarray):
+            return self._sym_arr[ids].tolist()
         return [self._id_to_sym[i] for i in ids]
 
 
@@ -82,14 +158,76 @@ class FSECppEncoder(DataEncoder):
         self._ctx = ctx
 
     def encode_block(self, data_block: DataBlock) -> bitarray:
-        """Encode using C++ implementation via symbol-to-ID mapping"""
-        # Map Python symbols to dense IDs, encode, then convert bytes to bitarray
-        mapped = self._ctx.map_symbols(data_block)
-        encoded = self._ctx.encoder.encode_block(mapped)
+        """Encode using C++ implementation via symbol-to-ID mapping
+
+        Byte-alphabet blocks backed by a uint8 ndarray skip the Python-side
+        mapping entirely: the raw buffer and the context's LUT go straight to
+        the fused C++ entry point, which maps and encodes in one pass.
+        """
+        ctx = self._ctx
+        data = data_block.data_list
+        if (
+            ctx._byte_lut is not None
+            and isinstance(data, np.ndarray)
+            and data.dtype == np.uint8
+        ):
+            if not data.flags["C_CONTIGUOUS"]:
+                data = np.ascontiguousarray(data)
+            if ctx._identity_byte_alphabet:
+                # symbol == id: the raw buffer is already the id sequence
+                n_sym = len(ctx._id_to_sym)
+                if n_sym < 256 and data.size and int(data.max()) >= n_sym:
+                    raise ValueError(
+                        "data block contains symbols not in the alphabet"
+                    )
+                encoded = ctx.encoder.encode_block(data)
+            else:
+                encoded = ctx.encoder.encode_block_bytes(data, ctx._byte_lut)
+        else:
+            encoded = ctx.encoder.encode_block(ctx.map_symbols(data_block))
         bits = bitarray(endian="big")
-        bits.frombytes(bytes(encoded.bytes))
-        # Truncate to actual bit count (last byte may be partially used)
-        return bits[: encoded.bit_count]
+        bits.frombytes(encoded.bytes)
+        # Truncate to actual bit count in place (last byte may be partially
+        # used); slicing bits[:n] would copy the whole payload just to drop
+        # a few pad bits
+        del bits[encoded.bit_count :]
+        return bits
+
+    def encode_blocks(self, data_blocks: List[DataBlock]) -> List[bitarray]:
+        """Encode many blocks in one C++ call
+
+        All id buffers are prepared first, then a single FFI call encodes the
+        whole batch, amortizing pybind call overhead across blocks - the win
+        is largest for many small blocks.
+        """
+        ctx = self._ctx
+        bufs = []
+        for data_block in data_blocks:
+            data = data_block.data_list
+            if (
+                ctx._identity_byte_alphabet
+                and isinstance(data, np.ndarray)
+                and data.dtype == np.uint8
+            ):
+                n_sym = len(ctx._id_to_sym)
+                if n_sym < 256 and data.size and int(data.max()) >= n_sym:
+                    raise ValueError(
+                        "data block contains symbols not in the alphabet"
+                    )
+                if not data.flags["C_CONTIGUOUS"]:
+                    data = np.ascontiguousarray(data)
+                bufs.append(data)
+            else:
+                mapped = ctx.map_symbols(data_block)
+                bufs.append(mapped if isinstance(mapped, bytes) else bytes(mapped))
+
+        results = []
+        for encoded in ctx.encoder.encode_blocks(bufs):
+            bits = bitarray(endian="big")
+            bits.frombytes(encoded.bytes)
+            del bits[encoded.bit_count :]
+            results.append(bits)
+        return results
 
     def reset(self):
         return None
@@ -103,9 +241,15 @@ class FSECppDecoder(DataDecoder):
 
     def decode_block(self, encoded_bits: bitarray) -> Tuple[DataBlock, int]:
         """Decode using C++ implementation via ID-to-symbol mapping"""
-        # Convert bitarray to bytes, decode to IDs, then map IDs back to symbols
-        decoded_bytes = list(encoded_bits.tobytes())
-        decoded_ids, bits_consumed = self._ctx.decoder.decode_block(decoded_bytes)
+        # Decode to IDs, then map IDs back to symbols. The bitarray's own
+        # byte buffer is read in place through the buffer protocol - no
+        # tobytes() copy and no boxed-int list on the way in. Passing the
+        # exact bit count tells the reader where the payload ends, so the
+        # pad bits in the final byte are never interpreted: the decoder
+        # masks every read and stops at the encoded bit count.
+        decoded_ids, bits_consumed = self._ctx.decoder.decode_block(
+            memoryview(encoded_bits), len(encoded_bits)
+        )
         decoded_syms = self._ctx.ids_to_symbols(decoded_ids)
         return DataBlock(decoded_syms), bits_consumed
 
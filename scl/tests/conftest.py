@@ -21,19 +21,19 @@ from pathlib import Path
 ########################################
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_freq():
     """Basic frequency distribution for testing"""
     return Frequencies({"A": 3, "B": 3, "C": 2})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_params(basic_freq):
     """Basic FSE params with small table for fast tests"""
     return FSEParams(basic_freq, TABLE_SIZE_LOG2=4)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_encoder(basic_params):
     """Basic FSE encoder"""
     from scl.compressors.fse import FSEEncoder
@@ -41,7 +41,7 @@ def basic_encoder(basic_params):
     return FSEEncoder(basic_params)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_decoder(basic_params):
     """Basic FSE decoder"""
     from scl.compressors.fse import FSEDecoder
@@ -49,7 +49,7 @@ def basic_decoder(basic_params):
     return FSEDecoder(basic_params)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_tables(basic_params):
     """Build all tables for basic test case"""
     norm_freq = basic_params.normalized_freqs
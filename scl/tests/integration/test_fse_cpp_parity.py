@@ -39,8 +39,10 @@ def test_cpp_matches_python_roundtrip(table_log, fse_cpp):
     cpp_dec = fse_cpp.FSEDecoder(cpp_tables)
 
     cpp_encoded = cpp_enc.encode_block(data)
+    # encoded.bytes is a bytes object; the buffer-protocol decode overload
+    # hands the dense ids back as bytes too
     cpp_decoded, bits_consumed = cpp_dec.decode_block(cpp_encoded.bytes)
-    assert cpp_decoded == data
+    assert list(cpp_decoded) == data
     assert bits_consumed == cpp_encoded.bit_count
 
     cpp_bits = bitarray(endian="big")